@@ -1,13 +1,27 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from Utilities.RIS_Voltage_map import (
+    NUMBA_AVAILABLE,
+    warm_up,
+    quantize_angle,
     ris_voltage_vector,
     load_data_from_directory,
     angle_from_voltage_vector,
 )
-from Utilities.connecting_to_pi import initialize_COM_port, send_to_pi, config_RIS
+from Utilities.connecting_to_pi import (
+    initialize_COM_port,
+    send_to_pi,
+    flush_to_pi,
+    config_RIS,
+)
+import json
+import queue
 import threading
-import time
+
+# Folder holding the preprogrammed (theta, phi) -> voltage vector files
+_PREPROGRAMMED_DIR = "new_matrix"
+# Older lines are dropped from the output log beyond this length
+_MAX_OUTPUT_LINES = 500
 
 
 class DualInputApp(tk.Tk):
@@ -17,6 +31,12 @@ class DualInputApp(tk.Tk):
         # Threading for listening to serial responses
         self.listening = False
         self.listener_thread = None
+        # Messages from the listener thread, drained on the Tk main thread
+        self.rx_queue = queue.Queue()
+        self._drain_job = None
+        # Pending output entries, flushed to the Text widget when Tk is idle
+        self._log_buf = []
+        self._log_flush_job = None
 
         # --- Window configuration ---
         self.title("Dual-Mode Input: Angles (θ, φ) or String")
@@ -27,10 +47,22 @@ class DualInputApp(tk.Tk):
         self._build_header()
         self._build_tabs()
         self._build_output()
+        self._drain_queue()
+
+        # Compile the steering code in the background so the first submit
+        # does not freeze the UI
+        threading.Thread(target=warm_up, daemon=True).start()
+        if not NUMBA_AVAILABLE:
+            self._write_output(
+                "numba not installed: steering runs without JIT "
+                "(optional, pip install numba).\n",
+                {},
+            )
 
         # Initialize COM port and configure RIS
         if initialize_COM_port():
-            config_RIS(0, "0-20V")
+            # Sent together with the first voltage vector
+            config_RIS(0, "0-20V", defer=True)
             self._write_output("COM port initialized successfully.\n", {})
             self.start_listener()
         else:
@@ -43,17 +75,31 @@ class DualInputApp(tk.Tk):
     def listen_for_responses(self):
         from Utilities.connecting_to_pi import ser
 
+        if ser is None:
+            return
+
         self.listening = True
         while self.listening:
             try:
-                if ser and ser.in_waiting > 0:
-                    response = ser.readline().decode("utf-8").strip()
+                # Blocks until a full line arrives or the port timeout expires
+                line = ser.readline()
+                if line:
+                    response = line.decode("utf-8").strip()
                     if response:
-                        self._write_output(f"Received from Pi:", {"response": response})
+                        self.rx_queue.put(("Received from Pi:", {"response": response}))
             except Exception as e:
-                self._write_output(f"Error reading from serial: {e}", {})
+                self.rx_queue.put((f"Error reading from serial: {e}", {}))
                 break
-            time.sleep(0.01)
+
+    def _drain_queue(self):
+        # Tk is not thread-safe: only the main thread touches the widgets
+        while True:
+            try:
+                header, payload = self.rx_queue.get_nowait()
+            except queue.Empty:
+                break
+            self._write_output(header, payload)
+        self._drain_job = self.after(50, self._drain_queue)
 
     def start_listener(self):
         if not self.listening:
@@ -101,7 +147,6 @@ class DualInputApp(tk.Tk):
         ttk.Label(grid, text="θ (deg):").grid(row=0, column=0, sticky="w", pady=4)
         self.theta_var = tk.StringVar()
         ttk.Label(grid, text="∈ [−90°, 90°]").grid(row=0, column=2, sticky="w", pady=4)
-        self.theta_var = tk.StringVar()
         theta_entry = ttk.Entry(grid, textvariable=self.theta_var, width=12)
         theta_entry.grid(row=0, column=1, sticky="w", padx=(6, 18))
         theta_entry.insert(0, "0")
@@ -110,7 +155,6 @@ class DualInputApp(tk.Tk):
         ttk.Label(grid, text="φ (deg):").grid(row=1, column=0, sticky="w", pady=4)
         self.phi_var = tk.StringVar()
         ttk.Label(grid, text="∈ [−90°, 90°]").grid(row=1, column=2, sticky="w", pady=4)
-        self.phi_var = tk.StringVar()
         phi_entry = ttk.Entry(grid, textvariable=self.phi_var, width=12)
         phi_entry.grid(row=1, column=1, sticky="w", padx=(6, 18))
         phi_entry.insert(0, "0")
@@ -146,8 +190,7 @@ class DualInputApp(tk.Tk):
         ).pack(anchor="w")
 
         # Preprogrammed strings
-
-        labels, label_to_data = load_data_from_directory("new_matrix")
+        labels, label_to_data = load_data_from_directory(_PREPROGRAMMED_DIR)
         self.label_to_data = label_to_data  # Store for later use
         self.combobox = ttk.Combobox(
             self.string_tab, values=labels, state="readonly", width=40
@@ -209,14 +252,15 @@ class DualInputApp(tk.Tk):
             }
             self._write_output("Received valid angles.\n", payload)
 
-            # Calculate corresponding voltage vector
+            # Calculate corresponding voltage vector (on the 0.1° angle grid)
             voltage_vector = ris_voltage_vector(theta, phi, max_phase=310)[0]
+            theta_q, phi_q = quantize_angle(theta), quantize_angle(phi)
             self._write_output(
-                f"Calculated and sending voltage vector for (theta={theta}, phi={phi}):\n",
+                f"Calculated and sending voltage vector for (theta={theta_q}, phi={phi_q}):\n",
                 {"voltage_vector": f"{voltage_vector}"},
             )
 
-            send_to_pi(str(voltage_vector) + "\n")
+            send_to_pi(json.dumps(voltage_vector, separators=(",", ":")) + "\n")
 
         else:  # String tab
             text = self.string_var.get()
@@ -253,19 +297,43 @@ class DualInputApp(tk.Tk):
         for k, v in payload.items():
             lines.append(f"{k}: {v}")
         lines.append(divider + "\n")
+        # Buffer the entry; a burst of messages is written in one idle update
+        self._log_buf.append("\n".join(lines))
+        if self._log_flush_job is None:
+            self._log_flush_job = self.after_idle(self._flush_log)
+
+    def _flush_log(self):
+        self._log_flush_job = None
+        if not self._log_buf:
+            return
+        text = "".join(self._log_buf)
+        self._log_buf.clear()
         self.output.configure(state="normal")
-        self.output.insert("end", "\n".join(lines))  # Append to the end
+        self.output.insert("end", text)  # Append to the end
+        # Keep only the most recent lines so redraws stay cheap
+        num_lines = int(self.output.index("end-1c").split(".")[0])
+        if num_lines > _MAX_OUTPUT_LINES:
+            self.output.delete("1.0", f"{num_lines - _MAX_OUTPUT_LINES + 1}.0")
         self.output.see("end")  # Scroll to the end
         self.output.configure(state="disabled")
 
     def _set_output_text(self, text):
+        self._log_buf.clear()
         self.output.configure(state="normal")
         self.output.delete("1.0", "end")
         self.output.insert("1.0", text)
         self.output.configure(state="disabled")
 
     def destroy(self):
+        # Make sure a vector submitted right before closing is still sent
+        flush_to_pi()
         self.stop_listener()
+        if self._drain_job is not None:
+            self.after_cancel(self._drain_job)
+            self._drain_job = None
+        if self._log_flush_job is not None:
+            self.after_cancel(self._log_flush_job)
+            self._log_flush_job = None
         super().destroy()
 
 
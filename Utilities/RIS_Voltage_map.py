@@ -1,6 +1,38 @@
+import functools
 import numpy as np
 import os
 
+# numba is an optional dependency (pip install numba). Without it the
+# steering code below runs as plain Python/NumPy with identical results.
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@functools.lru_cache(maxsize=4)
+def _load_coeffs(coeff_path):
+    """Load the polynomial coefficients once per path and reuse them."""
+    return np.load(coeff_path)["coefficients"]
+
+
+# Coefficients shipped next to this module, loaded into the cache at import so
+# the first GUI submit does not hit the disk.
+_DEFAULT_COEFF_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "coefficients.npz"
+)
+_load_coeffs(_DEFAULT_COEFF_PATH)
+
+# Wavenumber k = 2*pi/lambda at the 5 GHz operating frequency
+_K_5GHZ = 2 * np.pi / (3e8 / 5e9)
+
 
 def _rotate_into_window(angles_deg, window_width=290.0, atol=1e-9):
     """
@@ -10,28 +42,100 @@ def _rotate_into_window(angles_deg, window_width=290.0, atol=1e-9):
     Returns rotated angles (in [0, window_width]) and the rotation c (deg).
     Raises ValueError if impossible.
     """
+    rotated, c, span, ok = _fit_window(
+        np.asarray(angles_deg, dtype=np.float64), float(window_width), atol
+    )
+    if not ok:
+        raise _window_error(span, window_width)
+    return rotated, c, span
+
+
+def _window_error(span, window_width):
+    return ValueError(
+        f"Cannot fit all phases into [0, {window_width}] without changing the beam. "
+        f"Minimal required span is {span:.2f}° > {window_width}°. "
+        f"Consider reducing spacing, scan angle, or frequency."
+    )
+
+
+@njit(cache=True)
+def _fit_window(angles_deg, window_width, atol):
+    """
+    Compiled core of _rotate_into_window().
+
+    Returns (rotated, rotation_deg, span_deg, ok); ok is False when the
+    angles cannot be fitted into [0, window_width].
+    """
     a = np.sort(np.mod(angles_deg, 360.0))
-    N = len(a)
-    # Largest gap approach: the minimal arc covering all points is 360 - max_gap
-    diffs = np.diff(np.concatenate([a, [a[0] + 360.0]]))
-    k = int(np.argmax(diffs))
-    max_gap = diffs[k]
-    span = 360.0 - max_gap  # width of minimal circular arc containing all points
-
-    if span <= window_width + atol:
+    n = a.size
+    rotated = np.zeros(n)
+
+    lo = a[0]
+    span = a[n - 1] - lo
+    if span < 180.0:
+        # Fast path: if the phases span less than 180°, the wrap-around gap
+        # is the largest one, so the minimal arc starts at the smallest phase
+        c = -lo
+    else:
+        # Largest gap approach: the minimal arc covering all points is 360 - max_gap
+        kk = 0
+        max_gap = -1.0
+        for i in range(n):
+            nxt = a[i + 1] if i + 1 < n else a[0] + 360.0
+            gap = nxt - a[i]
+            if gap > max_gap:
+                kk = i
+                max_gap = gap
+        span = 360.0 - max_gap
         # Start of the minimal arc is the element right after the largest gap
-        start = a[(k + 1) % N]
-        c = -start
-        rotated = (angles_deg + c) % 360.0
+        c = -a[(kk + 1) % n]
+
+    if span > window_width + atol:
+        return rotated, 0.0, span, False
+
+    for i in range(n):
         # Numerical safety: clip tiny overshoots
-        rotated = np.clip(rotated, 0.0, window_width)
-        return rotated, c, span
-    else:
-        raise ValueError(
-            f"Cannot fit all phases into [0, {window_width}] without changing the beam. "
-            f"Minimal required span is {span:.2f}° > {window_width}°. "
-            f"Consider reducing spacing, scan angle, or frequency."
-        )
+        rotated[i] = min(max((angles_deg[i] + c) % 360.0, 0.0), window_width)
+    return rotated, c, span, True
+
+
+@njit(cache=True)
+def _steering_core(theta_deg, phi_deg, dy, dz, k, max_phase, atol):
+    """
+    Compiled core of steering_phases().
+
+    Returns (phases, phases_in_window, rotation_deg, span_deg, ok).
+    """
+    theta = np.deg2rad(theta_deg)
+    phi = np.deg2rad(phi_deg)
+
+    # Progressive phase steps
+    dphi_y = -k * dy * np.cos(theta) * np.sin(phi)
+    dphi_z = (
+        k * dz * np.sin(theta)
+    )  # Note: sign flipped because first measuremeent resultet in theta being fliped
+
+    # Build base phases in degrees, wrapped to [0,360)
+    # phases[j, i] = n_j * dphi_z + m_i * dphi_y  (row=j: z-index n, col=i: y-index m)
+    mn = np.array([-1.0, 0.0, 1.0])
+    phases = (
+        np.rad2deg(mn.reshape((3, 1)) * dphi_z + mn.reshape((1, 3)) * dphi_y) % 360.0
+    )
+
+    # Find rotation that fits all into [0, max_phase]
+    rotated, c, span, ok = _fit_window(phases.ravel(), max_phase, atol)
+    return phases, rotated.reshape((3, 3)), c, span, ok
+
+
+def warm_up():
+    """
+    Compile the numba kernels ahead of the first steering request.
+
+    Compilation is lazy and takes seconds on a cold cache, so the GUI runs
+    this on a background thread at startup. No-op without numba.
+    """
+    if NUMBA_AVAILABLE:
+        _steering_core(0.0, 0.0, 0.03, 0.03, _K_5GHZ, 290.0, 1e-9)
 
 
 def steering_phases(theta_deg, phi_deg, dy=None, dz=None, max_phase=290.0):
@@ -64,47 +168,17 @@ def steering_phases(theta_deg, phi_deg, dy=None, dz=None, max_phase=290.0):
     if dz is None:
         dz = 0.03
 
-    frequency = 5e9  # 5 GHz
-    wavelength = 3e8 / frequency
-
-    k = 2 * np.pi / wavelength
-    theta = np.deg2rad(theta_deg)
-    phi = np.deg2rad(phi_deg)
-
-    # Progressive phase steps
-    dphi_y = -k * dy * np.cos(theta) * np.sin(phi)
-    dphi_z = (
-        k * dz * np.sin(theta)
-    )  # Note: sign flipped because first measuremeent resultet in theta being fliped
-
-    # Build base phases in degrees, wrapped to [0,360)
-    base = []
-    idx_map = []  # (j,i) to put them back into 3x3
-    real_idx = []
-    for i, m in enumerate([-1, 0, 1]):  # y-direction index (columns)
-        for j, n in enumerate([-1, 0, 1]):  # z-direction index (rows)
-            phase = m * dphi_y + n * dphi_z
-            phase_deg = np.rad2deg(phase) % 360.0
-            base.append(phase_deg)
-            idx_map.append((j, i))
-            real_idx.append((n, m))
-
-    base = np.array(base)
-
-    # Find rotation that fits all into [0, max_phase]
-    phase_values_in_window, c_deg, span = _rotate_into_window(
-        base, window_width=max_phase
+    phases, phases_in_window, c_deg, span, ok = _steering_core(
+        float(theta_deg),
+        float(phi_deg),
+        float(dy),
+        float(dz),
+        _K_5GHZ,
+        float(max_phase),
+        1e-9,
     )
-
-    # Restore 3x3 array in the original (row=j, col=i) layout
-    phases_in_window = np.zeros((3, 3))
-    phases = np.zeros((3, 3))
-
-    for phase_value_in_window, (j, i), phase_value in zip(
-        phase_values_in_window, idx_map, base
-    ):
-        phases_in_window[j, i] = phase_value_in_window
-        phases[j, i] = phase_value
+    if not ok:
+        raise _window_error(span, max_phase)
 
     print("-" * 60)
     print(f"Steering angles: theta={theta_deg}°, phi={phi_deg}°: ")
@@ -112,8 +186,6 @@ def steering_phases(theta_deg, phi_deg, dy=None, dz=None, max_phase=290.0):
     print("Phase mapping info:")
     print(f"  Original phases (deg):\n{phases}")
     print(f"  Mapped phases (deg):\n{phases_in_window}")
-    print(f"  Index map (row, col): {idx_map}")
-    print(f"  Real index (n, m): {real_idx}")
 
     info = {"rotation_deg": c_deg, "span_deg": span}
     return phases_in_window, info
@@ -144,7 +216,7 @@ def _invert_volt_map_lut(voltages, coeffs_1d, max_phase=290.0, lut_points=20001)
 
 def angle_from_voltage_vector(
     voltage_vector,
-    coeff_path="Utilities/coefficients.npz",
+    coeff_path=_DEFAULT_COEFF_PATH,
     freq_idx=0,
     dy=0.03,
     dz=0.03,
@@ -163,8 +235,7 @@ def angle_from_voltage_vector(
         raise ValueError("voltage_vector must have length 9.")
 
     # 1) Voltages -> phases in [0, max_phase]
-    coeff_data = np.load(coeff_path)
-    coeffs = coeff_data["coefficients"]
+    coeffs = _load_coeffs(coeff_path)
     phases_win = _invert_volt_map_lut(
         voltage_vector, coeffs[freq_idx], max_phase=max_phase, lut_points=lut_points
     )
@@ -188,9 +259,7 @@ def angle_from_voltage_vector(
     dphi_z = b
 
     # 4) Invert the steering equations (match your steering_phases() signs) :contentReference[oaicite:2]{index=2}
-    frequency = 5e9
-    wavelength = 3e8 / frequency
-    k = 2 * np.pi / wavelength
+    k = _K_5GHZ
 
     # theta from dphi_z = k*dz*sin(theta)
     s_theta = dphi_z / (k * dz)
@@ -228,13 +297,23 @@ def angle_from_voltage_vector(
 
 # Function to compute voltage vector for given theta and phi
 
+# Steering angles are quantized to this many decimals (0.1°) before lookup
+_ANGLE_DECIMALS = 1
+
+
+def quantize_angle(angle_deg):
+    """Round an angle to the grid ris_voltage_vector() computes results on."""
+    return round(float(angle_deg), _ANGLE_DECIMALS)
+
 
 def ris_voltage_vector(
     theta_deg,
     phi_deg,
-    coeff_path="Utilities/coefficients.npz",
+    coeff_path=_DEFAULT_COEFF_PATH,
     freq_idx=0,
     max_phase=290.0,
+    dy=None,
+    dz=None,
 ):
     """
     Compute the voltage vector for the RIS for given steering angles.
@@ -251,6 +330,8 @@ def ris_voltage_vector(
         Frequency index to use from coefficients.
     max_phase : float
         Maximum allowed phase (degrees).
+    dy, dz : float
+        Element spacing in meters, see steering_phases(). Default: 0.03 m.
 
     Returns
     -------
@@ -262,24 +343,46 @@ def ris_voltage_vector(
         3x3 voltage matrix (V).
     info : dict
         Diagnostics from phase calculation.
+
+    Notes
+    -----
+    Angles are rounded with quantize_angle() (0.1° grid) and results are
+    memoized, so repeated submits of the same direction skip the computation.
+    The returned arrays are read-only.
     """
-    # Load coefficients
-    coeff_data = np.load(coeff_path)
-    coeffs = coeff_data["coefficients"]
+    voltage_vector, phases, voltages, info = _ris_voltage_vector_cached(
+        quantize_angle(theta_deg),
+        quantize_angle(phi_deg),
+        coeff_path,
+        freq_idx,
+        max_phase,
+        dy,
+        dz,
+    )
+    # Fresh containers so callers cannot alter the cached entry
+    return list(voltage_vector), phases, voltages, dict(info)
+
+
+@functools.lru_cache(maxsize=512)
+def _ris_voltage_vector_cached(
+    theta_deg, phi_deg, coeff_path, freq_idx, max_phase, dy, dz
+):
+    coeffs = _load_coeffs(coeff_path)
 
     # Calculate phases and voltages
-    phases, info = steering_phases(theta_deg, phi_deg, max_phase=max_phase)
-    voltages = np.vectorize(lambda p: volt_map(p, coeffs[freq_idx]))(phases)
+    phases, info = steering_phases(
+        theta_deg, phi_deg, dy=dy, dz=dz, max_phase=max_phase
+    )
+    voltages = volt_map(phases, coeffs[freq_idx])
     voltage_vector = voltages.round(2).flatten().tolist()
+    phases.setflags(write=False)
+    voltages.setflags(write=False)
     return voltage_vector, phases, voltages, info
 
 
 def volt_map(phase, coeffs):
-    num = len(coeffs)
-    ret = 0
-    for i in range(num):
-        ret = ret + coeffs[i] * phase ** (num - 1 - i)
-    return ret
+    # Horner evaluation of the phase->voltage polynomial (highest order first)
+    return np.polyval(coeffs, phase)
 
 
 def load_data_from_directory(folder_path):
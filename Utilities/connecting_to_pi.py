@@ -1,6 +1,5 @@
 import serial
 import json
-import time
 import threading
 import serial.tools.list_ports
 
@@ -11,58 +10,105 @@ ser = None  # Global serial connection
 def initialize_COM_port(baudrate=9600, timeout=1):
     global ser
     ports = serial.tools.list_ports.comports()
-    for port in ports:
-        if (
-            "USB" in port.description
-            or "USB" in port.hwid
-            or "Serial" in port.description
-        ):
-            ser = serial.Serial(port.device, baudrate=baudrate, timeout=timeout)
-            print(f"Connected to {port.device}")
-            return True
-    print("No USB-Serial device found.")
-    return False
+    # Only the first matching port is opened
+    port = next(
+        (
+            p
+            for p in ports
+            if "USB" in p.description or "Serial" in p.description or "USB" in p.hwid
+        ),
+        None,
+    )
+    if port is None:
+        print("No USB-Serial device found.")
+        return False
+    ser = serial.Serial(port.device, baudrate=baudrate, timeout=timeout)
+    print(f"Connected to {port.device}")
+    return True
+
+
+# Outgoing data is coalesced and written in one go, either once the buffer
+# reaches _TX_FLUSH_SIZE bytes or _TX_FLUSH_DELAY seconds after the first send.
+_TX_FLUSH_DELAY = 0.005
+_TX_FLUSH_SIZE = 256
+_tx_buf = bytearray()
+_tx_lock = threading.Lock()
+_tx_timer = None
+# Config message held back by config_RIS(defer=True) until the first data write
+_pending_config = b""
 
 
 def send_to_pi(data):
-    global ser
+    global _tx_timer
     if ser and ser.is_open:
         if isinstance(data, str):
             data = data.encode("utf-8")
-        ser.write(data)
-        print("Data sent.")
+        with _tx_lock:
+            _tx_buf.extend(data)
+            if len(_tx_buf) >= _TX_FLUSH_SIZE:
+                _flush_tx_locked()
+            elif _tx_timer is None:
+                _tx_timer = threading.Timer(_TX_FLUSH_DELAY, _flush_tx)
+                _tx_timer.daemon = True
+                _tx_timer.start()
     else:
         print("Serial connection not initialized.")
 
 
-# Flag to control the listening thread
-listening = True
+def send_bytes(payload: bytes):
+    """Write payload immediately, together with anything still buffered."""
+    if ser and ser.is_open:
+        with _tx_lock:
+            _tx_buf.extend(payload)
+            _flush_tx_locked()
+    else:
+        print("Serial connection not initialized.")
 
 
-def listen_for_responses():
-    """Continuously listen for incoming messages from the Pi"""
-    global listening
-    while listening:
+def flush_to_pi():
+    """Write any data still waiting in the send buffer."""
+    _flush_tx()
+
+
+def _flush_tx():
+    with _tx_lock:
+        _flush_tx_locked()
+
+
+def _flush_tx_locked():
+    # Caller must hold _tx_lock
+    global _tx_timer, _pending_config
+    if _tx_timer is not None:
+        _tx_timer.cancel()
+        _tx_timer = None
+    if _tx_buf:
+        # A deferred config goes out in the same write as the first data
+        payload = _pending_config + bytes(_tx_buf)
         try:
-            if ser.in_waiting > 0:
-                response = ser.readline().decode("utf-8").strip()
-                if response:
-                    print("Received from Pi:", response)
+            ser.write(payload)
         except Exception as e:
-            print(f"Error reading from serial: {e}")
-            break
-        time.sleep(0.01)  # Small delay to prevent excessive CPU usage
-
+            print(f"Error writing to serial: {e}")
+            return
+        finally:
+            # Never resend stale vectors ahead of the next command
+            _tx_buf.clear()
+        # The config is kept for the next write until it actually went out
+        _pending_config = b""
+        print("Data sent.")
 
-# Start the listening thread
-listener_thread = threading.Thread(target=listen_for_responses, daemon=True)
-listener_thread.start()
 
 # initialize_COM_port()
 
 # Configure the DAC:
 
-def config_RIS(daisy_chain_device_num = 0, voltage_range = "0-10V"):
+def config_RIS(daisy_chain_device_num = 0, voltage_range = "0-10V", defer=False):
+    """
+    Send the DAC configuration to the Pi.
+
+    With defer=True the message is held back and prepended to the next
+    send_to_pi()/send_bytes() write, saving a separate USB transfer.
+    """
+    global _pending_config
     config_msg = (
         json.dumps(
             {
@@ -73,7 +119,12 @@ def config_RIS(daisy_chain_device_num = 0, voltage_range = "0-10V"):
         )
         + "\n"
     )
-    ser.write(config_msg.encode("utf-8"))
+    if defer:
+        with _tx_lock:
+            _pending_config = config_msg.encode("utf-8")
+        print("Configuration queued:", config_msg)
+        return
+    send_bytes(config_msg.encode("utf-8"))
     print("Configuration sent:", config_msg)
 
 # Example usage:
@@ -90,8 +141,6 @@ def config_RIS(daisy_chain_device_num = 0, voltage_range = "0-10V"):
 #     time.sleep(5)
 # 
 # finally:
-#     listening = False  # Stop the listening thread
-#     listener_thread.join(timeout=1)  # Wait for thread to finish
 #     ser.close()
 #     print("Serial connection closed.")
 # 
\ No newline at end of file
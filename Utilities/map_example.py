@@ -3,11 +3,7 @@ import matplotlib.pyplot as plt
 
 # polynomial mapping from phase (degrees) to voltage (V)
 def volt_map(phase, coeffs):
-    num = len(coeffs)
-    ret = 0
-    for i in range(num):
-        ret = ret + coeffs[i]*phase**(num-1-i)
-    return ret
+    return np.polyval(coeffs, phase)
 
 
 phase_file = "phases.npz"
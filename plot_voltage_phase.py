@@ -24,17 +24,7 @@ phase_points = np.linspace(0, 360, 1000)
 
 
 # polynomial evaluation
-def volt_map(phase, coeffs):
-    num = len(coeffs)
-    ret = 0
-    for i in range(num):
-        ret = ret + coeffs[i] * phase ** (num - 1 - i)
-    return ret
-
-
-voltages_from_phase = np.vectorize(lambda p: volt_map(p, coefficients[idx]))(
-    phase_points
-)
+voltages_from_phase = np.polyval(coefficients[idx], phase_points)
 
 voltages_from_phase = np.where(
     voltages_from_phase < max_voltage, voltages_from_phase, np.nan